@@ -27,14 +27,77 @@ Notes:
 """
 import argparse
 import csv
+import functools
 import logging
 import re
 from pathlib import Path
-from typing import Dict, List, Match, Pattern, Union
+from typing import Dict, List, Match, Optional, Pattern, Sequence, Tuple, Union
 
 __version__ = "0.1.0"
 logger: logging.Logger = logging.getLogger(__name__)
 
+_SKU_RE: Pattern[str] = re.compile(
+    r"\ANG(?P<Class>\d)(?P<Length>\d{1,2})(?P<CuffStyle>CBC|BC|C|)(?P<Color>BYB|YB|RB|B)"
+    r"[/-](?P<Size>[0-9H]+)/?(?P<RFID>(?:RF)?)(?P<EXTRA>.*)",
+    re.ASCII,
+)
+_CUFF_STYLES: Dict[str, str] = {
+    "": "Straight Cuff",
+    "BC": "Bell Cuff",
+    "C": "Contour Cuff",
+    "CBC": "Contour Bell Cuff",
+}
+_COLORS: Dict[str, str] = {
+    "B": "Black",
+    "RB": "Red/Black",
+    "YB": "Yellow/Black",
+    "BYB": "Black/Yellow/Black",
+    "BL": "Blue",
+    "BLO": "Blue/Orange",
+}
+_SIZE_CHARS: str = "0123456789H"
+# Class and Length values as ints, keyed by their one or two digit strings.
+_INTS: Dict[str, int] = {
+    **{str(number): number for number in range(10)},
+    **{f"{number:02d}": number for number in range(100)},
+}
+_ATTRIBUTE_NAMES: Tuple[str, ...] = (
+    "Class",
+    "Length",
+    "Length UOM",
+    "Cuff Style",
+    "Color",
+    "Size",
+    "RFID",
+    "EXTRA",
+)
+_EMPTY_VALUES: Tuple[str, ...] = ("",) * len(_ATTRIBUTE_NAMES)
+# Decoded Class, Length, Length UOM, Cuff Style and Color values for the SKU
+# prefixes (everything before the size separator) of the glove classes 0-4 with
+# two digit lengths, e.g. "NG216BCRB" -> (2, 16, "inch", "Bell Cuff", "Red/Black").
+# Lengths are digits and cuff style + color tokens are letters that split only
+# one way, so each prefix has exactly one decoding. Other prefixes go through
+# _SKU_RE.
+_PREFIX_TABLE: Dict[str, Tuple[Union[str, int], ...]] = {
+    f"NG{class_}{length}{cuff}{color}": (
+        _INTS[class_],
+        _INTS[length],
+        "inch",
+        _CUFF_STYLES[cuff],
+        _COLORS[color],
+    )
+    for class_ in "01234"
+    for length in map(str, range(10, 100))
+    for cuff in ("", "BC", "C", "CBC")
+    for color in ("B", "RB", "YB", "BYB")
+}
+_EMPTY_RESULT: Dict[str, Union[str, int]] = dict.fromkeys(_ATTRIBUTE_NAMES, "")
+# Read and write the CSV files in 1 MiB chunks instead of the default 8 KiB.
+_BUFFER_SIZE: int = 1 << 20
+# Number of output lines joined into a single write() call.
+_BATCH_SIZE: int = 8192
+_EMPTY_FIELDS: str = "," * len(_ATTRIBUTE_NAMES)
+
 
 def get_attributes_from_sku(sku: str) -> Dict[str, Union[str, int]]:
     """Parses a SKU string into a dictionary of product attributes.
@@ -60,50 +123,134 @@ def get_attributes_from_sku(sku: str) -> Dict[str, Union[str, int]]:
         - If the SKU is invalid, returns an empty dictionary.
 
     """
-    pattern: Pattern[str] = re.compile(
-        r"NG(?P<Class>\d)(?P<Length>\d{1,2})(?=[A-Z]+)(?P<CuffStyle>(?:BC)?|C?|(?:CBC)?)(?=B|RB|YB)"
-        r"(?P<Color>B|RB|YB|BYB)(?:\/|-)(?P<Size>[0-9H]+)\/?(?P<RFID>(?:RF)?)(?P<EXTRA>.*)"  # noqa: E501 pylint: disable=C0301:line-too-long
-    )
-    match: Match[str] | None = pattern.match(sku)
-    if not match:
-        logger.warning("Invalid SKU: %s. Match: %s", sku, match)
-        return {
-            "Class": "",
-            "Length": "",
-            "Length UOM": "",
-            "Cuff Style": "",
-            "Color": "",
-            "Size": "",
-            "RFID": "",
-            "EXTRA": "",
-        }
+    values: Tuple[Union[str, int], ...] = _get_attribute_values(sku)
+    if values is _EMPTY_VALUES:
+        return _EMPTY_RESULT.copy()
+    return dict(zip(_ATTRIBUTE_NAMES, values))
+
+
+def _get_attribute_values(sku: str) -> Tuple[Union[str, int], ...]:
+    """Parses a SKU string into a tuple of attribute values.
+
+    Args:
+        sku (str): The product SKU string to parse.
+
+    Returns:
+        tuple[Union[str, int], ...]: The attribute values in _ATTRIBUTE_NAMES
+        order. All values are empty strings if the SKU is invalid.
+    """
+    values: Optional[Tuple[Union[str, int], ...]] = _parse_sku(sku)
+    if values is None:
+        logger.warning("Invalid SKU: %s. Match: %s", sku, None)
+        return _EMPTY_VALUES
         # raise ValueError(f"Invalid SKU: {sku}")
-    props: Dict[str, str] = match.groupdict()
-    cuff_styles: Dict[str, str] = {
-        "": "Straight Cuff",
-        "BC": "Bell Cuff",
-        "C": "Contour Cuff",
-        "CBC": "Contour Bell Cuff",
-    }
-    colors: Dict[str, str] = {
-        "B": "Black",
-        "RB": "Red/Black",
-        "YB": "Yellow/Black",
-        "BYB": "Black/Yellow/Black",
-        "BL": "Blue",
-        "BLO": "Blue/Orange",
-    }
-    attributes: Dict[str, Union[str, int]] = {
-        "Class": int(props["Class"]),
-        "Length": int(props["Length"]),
-        "Length UOM": "inch",
-        "Cuff Style": cuff_styles.get(props["CuffStyle"], "Unknown"),
-        "Color": colors.get(props["Color"], "Unknown"),
-        "Size": props["Size"],
-        "RFID": "Yes" if props["RFID"] == "RF" else "No",
-        "EXTRA": props["EXTRA"],
-    }
-    return attributes
+    return values
+
+
+@functools.lru_cache(maxsize=8192)
+def _get_attribute_fields(sku: str) -> Optional[str]:
+    """Formats the attribute values of a SKU as CSV fields to append to a row.
+
+    Args:
+        sku (str): The product SKU string to parse.
+
+    Returns:
+        Optional[str]: The attribute values joined with commas, including the
+        leading comma, or None if any of them needs quoting. _EMPTY_FIELDS if
+        the SKU is invalid.
+    """
+    values: Optional[Tuple[Union[str, int], ...]] = _parse_sku(sku)
+    if values is None:
+        return _EMPTY_FIELDS
+    fields: Optional[str] = _join_csv_fields([str(value) for value in values])
+    return None if fields is None else "," + fields
+
+
+def _join_csv_fields(fields: Sequence[str]) -> Optional[str]:
+    """Joins fields into a CSV line when none of them needs quoting.
+
+    Args:
+        fields (Sequence[str]): The fields to join.
+
+    Returns:
+        Optional[str]: The fields joined with commas, or None if any field
+        contains a comma, a quote or a line break.
+    """
+    line: str = ",".join(fields)
+    if (
+        line.count(",") != len(fields) - 1
+        or '"' in line
+        or "\r" in line
+        or "\n" in line
+    ):
+        return None
+    return line
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_sku(sku: str) -> Optional[Tuple[Union[str, int], ...]]:
+    """Parses a SKU string into its attribute values.
+
+    Results are cached since input files usually repeat the same SKU on many
+    rows. The values are returned as a tuple, in _ATTRIBUTE_NAMES order, so the
+    cached entries can't be modified by callers.
+
+    Args:
+        sku (str): The product SKU string to parse.
+
+    Returns:
+        Optional[tuple[Union[str, int], ...]]: The attribute values, or None if
+        the SKU is invalid.
+    """
+    values: Optional[Tuple[Union[str, int], ...]] = _parse_common_sku(sku)
+    if values is not None:
+        return values
+    match: Match[str] | None = _SKU_RE.match(sku)
+    if not match:
+        return None
+    class_, length, cuff_style, color, size, rfid, extra = match.group(
+        "Class", "Length", "CuffStyle", "Color", "Size", "RFID", "EXTRA"
+    )
+    return (
+        _INTS[class_],
+        _INTS[length],
+        "inch",
+        _CUFF_STYLES.get(cuff_style, "Unknown"),
+        _COLORS.get(color, "Unknown"),
+        size,
+        "Yes" if rfid == "RF" else "No",
+        extra,
+    )
+
+
+def _parse_common_sku(sku: str) -> Optional[Tuple[Union[str, int], ...]]:
+    """Parses a SKU with the usual shape using _PREFIX_TABLE.
+
+    Fast path for _parse_sku(). The part before the first "/" or "-" is looked
+    up in _PREFIX_TABLE and only Size, RFID and EXTRA are split from the rest.
+    Returns None when the SKU does not have the usual shape, in which case the
+    caller falls back to the regex.
+
+    Args:
+        sku (str): The product SKU string to parse.
+
+    Returns:
+        Optional[tuple[Union[str, int], ...]]: The attribute values or None.
+    """
+    slash = sku.find("/")
+    dash = sku.find("-")
+    sep = min(slash, dash) if slash >= 0 and dash >= 0 else max(slash, dash)
+    if sep < 0:
+        return None
+    head: Optional[Tuple[Union[str, int], ...]] = _PREFIX_TABLE.get(sku[:sep])
+    if head is None:
+        return None
+    size, _, tail = sku[sep + 1 :].partition("/")
+    if not size or size.strip(_SIZE_CHARS) or "\n" in tail:
+        return None
+    if tail.startswith("RF"):
+        return head + (size, "Yes", tail[2:])
+    return head + (size, "No", tail)
 
 
 def parse_skus(inputfile: Path, outputfile: Path, sku_column: str) -> None:
@@ -117,38 +264,71 @@ def parse_skus(inputfile: Path, outputfile: Path, sku_column: str) -> None:
     Returns:
         None: Output CSV file written to disk.
 
+    Raises:
+        KeyError: If the SKU column is not in the input CSV header.
+        ValueError: If a row has more fields than the input CSV header.
+
     Notes:
-        - Input CSV opened as utf-8 text.
-        - Output CSV opened as utf-8 text with newline=''.
+        - Input CSV opened as utf-8 text with a 1 MiB buffer.
+        - Output CSV opened as utf-8 text with newline='' and a 1 MiB buffer.
         - Writes electriflex_gloves.log to current working directory.
-        - Calls get_attributes_from_sku() to parse each SKU.
-        - Merges parsed attributes with original row from input CSV.
+        - Appends the attribute values of each SKU to the original row from
+          input CSV.
+        - Rows with no fields that need quoting are joined and written
+          directly, the rest go through csv.writer.
+        - Pads rows that are shorter than the header with empty fields.
         - Writes output CSV header from input header plus new columns.
 
     See also:
         get_attributes_from_sku: Parses a single SKU into attribute dict.
+        _get_attribute_fields: Formats the attributes of a SKU as CSV fields.
     """
     logger.info("Parsing SKUs from file %s", inputfile.as_posix())
-    with inputfile.open("r", encoding="utf-8") as f, outputfile.open(
-        "w", encoding="utf-8", newline=""
+    with inputfile.open(
+        "r", buffering=_BUFFER_SIZE, encoding="utf-8"
+    ) as f, outputfile.open(
+        "w", buffering=_BUFFER_SIZE, encoding="utf-8", newline=""
     ) as of:
-        reader = csv.DictReader(f, dialect="excel")
-        header: List[str] = []
+        reader = csv.reader(f, dialect="excel")
+        header: List[str] = next(reader, [])
         # header: list[str] = ["Item no.", "SKU"]
-        if reader.fieldnames:
-            header = list(reader.fieldnames)
-        output_header_written: bool = False
+        if not header:
+            return
+        if sku_column not in header:
+            logger.error("SKU column not found: %s", sku_column)
+            raise KeyError(f"SKU column not found: {sku_column}")
+        sku_index: int = header.index(sku_column)
+        width: int = len(header)
+        writer = csv.writer(of, dialect="excel")
+        writer.writerow(header + list(_ATTRIBUTE_NAMES))
+        terminator: str = writer.dialect.lineterminator
+        warn_invalid: bool = logger.isEnabledFor(logging.WARNING)
+        lines: List[str] = []
         for row in reader:
-            sku = row[sku_column]
+            if len(row) != width:
+                if not row:
+                    continue
+                if len(row) > width:
+                    logger.error("Too many fields on line %s", reader.line_num)
+                    raise ValueError(f"Too many fields on line {reader.line_num}")
+                row.extend([""] * (width - len(row)))
+            sku: str = row[sku_index]
             # logger.info("Parsing SKU: %s", sku)
-            attributes: dict[str, Union[str, int]] = get_attributes_from_sku(sku)
-            if not output_header_written:
-                header.extend(attributes.keys())
-                writer = csv.DictWriter(of, fieldnames=header, dialect="excel")
-                writer.writeheader()
-                output_header_written = True
-            out_row: dict[str, Union[str, int]] = {**row, **attributes}
-            writer.writerow(out_row)  # type: ignore
+            fields: Optional[str] = _get_attribute_fields(sku)
+            if fields is _EMPTY_FIELDS and warn_invalid:
+                logger.warning("Invalid SKU: %s. Match: %s", sku, None)
+            line: Optional[str] = None if fields is None else _join_csv_fields(row)
+            if line is not None:
+                lines.append(f"{line}{fields}{terminator}")
+                if len(lines) >= _BATCH_SIZE:
+                    of.write("".join(lines))
+                    lines.clear()
+            else:
+                # Some field needs quoting, leave it to csv.writer.
+                of.write("".join(lines))
+                lines.clear()
+                writer.writerow([*row, *(_parse_sku(sku) or _EMPTY_VALUES)])
+        of.write("".join(lines))
 
 
 def argument_parser() -> argparse.ArgumentParser:
@@ -1,7 +1,9 @@
 """Tests for electriflex_gloves.py"""
+from pathlib import Path
+
 import pytest
 
-from electriflex_gloves_sku_parser import get_attributes_from_sku, main
+from electriflex_gloves_sku_parser import get_attributes_from_sku, main, parse_skus
 
 
 @pytest.mark.parametrize(
@@ -85,6 +87,97 @@ from electriflex_gloves_sku_parser import get_attributes_from_sku, main
                 "EXTRA": "",
             },
         ),
+        (
+            "NG216BYB-10H/RF/CLIF",
+            {
+                "Class": 2,
+                "Length": 16,
+                "Length UOM": "inch",
+                "Cuff Style": "Straight Cuff",
+                "Color": "Black/Yellow/Black",
+                "Size": "10H",
+                "RFID": "Yes",
+                "EXTRA": "/CLIF",
+            },
+        ),
+        (
+            "NG25YB/9",
+            {
+                "Class": 2,
+                "Length": 5,
+                "Length UOM": "inch",
+                "Cuff Style": "Straight Cuff",
+                "Color": "Yellow/Black",
+                "Size": "9",
+                "RFID": "No",
+                "EXTRA": "",
+            },
+        ),
+        (
+            "NG216YB/9RF",
+            {
+                "Class": 2,
+                "Length": 16,
+                "Length UOM": "inch",
+                "Cuff Style": "Straight Cuff",
+                "Color": "Yellow/Black",
+                "Size": "9",
+                "RFID": "Yes",
+                "EXTRA": "",
+            },
+        ),
+        (
+            "NG216YB/9-x",
+            {
+                "Class": 2,
+                "Length": 16,
+                "Length UOM": "inch",
+                "Cuff Style": "Straight Cuff",
+                "Color": "Yellow/Black",
+                "Size": "9",
+                "RFID": "No",
+                "EXTRA": "-x",
+            },
+        ),
+        (
+            "NG216YB/9a",
+            {
+                "Class": 2,
+                "Length": 16,
+                "Length UOM": "inch",
+                "Cuff Style": "Straight Cuff",
+                "Color": "Yellow/Black",
+                "Size": "9",
+                "RFID": "No",
+                "EXTRA": "a",
+            },
+        ),
+        (
+            "NG716YB/9",
+            {
+                "Class": 7,
+                "Length": 16,
+                "Length UOM": "inch",
+                "Cuff Style": "Straight Cuff",
+                "Color": "Yellow/Black",
+                "Size": "9",
+                "RFID": "No",
+                "EXTRA": "",
+            },
+        ),
+        (
+            "NG205YB/9",
+            {
+                "Class": 2,
+                "Length": 5,
+                "Length UOM": "inch",
+                "Cuff Style": "Straight Cuff",
+                "Color": "Yellow/Black",
+                "Size": "9",
+                "RFID": "No",
+                "EXTRA": "",
+            },
+        ),
     ),
 )
 def test_get_attributes_from_sku(sku, expected):
@@ -93,6 +186,125 @@ def test_get_attributes_from_sku(sku, expected):
     assert attributes == expected
 
 
+def test_get_attributes_from_sku_returns_new_dict():
+    """Test repeated SKUs don't share the returned dictionary"""
+    attributes = get_attributes_from_sku("NG216YB/9")
+    attributes["Size"] = "10"
+    assert get_attributes_from_sku("NG216YB/9")["Size"] == "9"
+
+
+@pytest.mark.parametrize(
+    "sku", ("", "NG", "XX216YB/9", "NG216XX/9", "NG2160YB/9", "NG٣16YB/9")
+)
+def test_get_attributes_from_invalid_sku(sku):
+    """Test get_attributes_from_sku with invalid SKUs"""
+    attributes = get_attributes_from_sku(sku)
+    assert set(attributes) == {
+        "Class",
+        "Length",
+        "Length UOM",
+        "Cuff Style",
+        "Color",
+        "Size",
+        "RFID",
+        "EXTRA",
+    }
+    assert all(value == "" for value in attributes.values())
+
+
+def test_parse_skus(tmpdir, caplog: pytest.LogCaptureFixture) -> None:
+    """Test parse_skus"""
+    input_file = tmpdir.join("input.csv")
+    output_file = tmpdir.join("output.csv")
+    input_file.write_text(
+        "Item no.,SKU,Description\n"
+        '1,NG216YB/9,"Glove, class 2"\n'
+        "2,NG418CRB/12/RF,\n"
+        "\n"
+        "3,INVALID\n"
+        '4,"NG216YB/9/A,B",\n',
+        encoding="utf-8",
+    )
+
+    parse_skus(Path(input_file), Path(output_file), "SKU")
+
+    assert output_file.read_text(encoding="utf-8").splitlines() == [
+        "Item no.,SKU,Description,Class,Length,Length UOM,Cuff Style,Color,Size,RFID,EXTRA",
+        '1,NG216YB/9,"Glove, class 2",2,16,inch,Straight Cuff,Yellow/Black,9,No,',
+        "2,NG418CRB/12/RF,,4,18,inch,Contour Cuff,Red/Black,12,Yes,",
+        "3,INVALID,,,,,,,,,",
+        '4,"NG216YB/9/A,B",,2,16,inch,Straight Cuff,Yellow/Black,9,No,"A,B"',
+    ]
+    assert "Invalid SKU: INVALID. Match: None" in caplog.text
+
+
+def test_parse_skus_batches(tmpdir, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test parse_skus keeps row order across batch flushes"""
+    monkeypatch.setattr("electriflex_gloves_sku_parser._BATCH_SIZE", 2)
+    input_file = tmpdir.join("input.csv")
+    output_file = tmpdir.join("output.csv")
+    input_file.write_text(
+        "Item no.,SKU,Description\n"
+        "1,NG216YB/9,plain\n"
+        "2,NG216YB/10,plain\n"
+        '3,NG216YB/11,"quoted, text"\n'
+        "4,NG418CRB/12,plain\n"
+        "5,NG418CRB/12/RF,plain\n"
+        "6,NG216YB/9,plain\n"
+        '7,"NG216YB/9/A,B",plain\n'
+        "8,INVALID,plain\n",
+        encoding="utf-8",
+    )
+
+    parse_skus(Path(input_file), Path(output_file), "SKU")
+
+    assert Path(output_file).read_bytes().decode("utf-8").split("\r\n") == [
+        "Item no.,SKU,Description,Class,Length,Length UOM,Cuff Style,Color,Size,RFID,EXTRA",
+        "1,NG216YB/9,plain,2,16,inch,Straight Cuff,Yellow/Black,9,No,",
+        "2,NG216YB/10,plain,2,16,inch,Straight Cuff,Yellow/Black,10,No,",
+        '3,NG216YB/11,"quoted, text",2,16,inch,Straight Cuff,Yellow/Black,11,No,',
+        "4,NG418CRB/12,plain,4,18,inch,Contour Cuff,Red/Black,12,No,",
+        "5,NG418CRB/12/RF,plain,4,18,inch,Contour Cuff,Red/Black,12,Yes,",
+        "6,NG216YB/9,plain,2,16,inch,Straight Cuff,Yellow/Black,9,No,",
+        '7,"NG216YB/9/A,B",plain,2,16,inch,Straight Cuff,Yellow/Black,9,No,"A,B"',
+        "8,INVALID,plain,,,,,,,,",
+        "",
+    ]
+
+
+def test_parse_skus_header_only(tmpdir) -> None:
+    """Test parse_skus with an input file without rows"""
+    input_file = tmpdir.join("input.csv")
+    output_file = tmpdir.join("output.csv")
+    input_file.write_text("Item no.,SKU\n", encoding="utf-8")
+
+    parse_skus(Path(input_file), Path(output_file), "SKU")
+
+    assert output_file.read_text(encoding="utf-8").splitlines() == [
+        "Item no.,SKU,Class,Length,Length UOM,Cuff Style,Color,Size,RFID,EXTRA",
+    ]
+
+
+def test_parse_skus_missing_sku_column(tmpdir) -> None:
+    """Test parse_skus with a missing SKU column"""
+    input_file = tmpdir.join("input.csv")
+    input_file.write_text("Item no.,SKU_CODE\n1,NG216YB/9\n", encoding="utf-8")
+
+    with pytest.raises(KeyError):
+        parse_skus(Path(input_file), Path(tmpdir.join("output.csv")), "SKU")
+
+
+def test_parse_skus_too_many_fields(tmpdir) -> None:
+    """Test parse_skus with a row that has more fields than the header"""
+    input_file = tmpdir.join("input.csv")
+    input_file.write_text(
+        "Item no.,SKU\n1,NG216YB/9\n2,NG216YB/9,extra\n", encoding="utf-8"
+    )
+
+    with pytest.raises(ValueError, match="Too many fields on line 3"):
+        parse_skus(Path(input_file), Path(tmpdir.join("output.csv")), "SKU")
+
+
 def test_argument_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test argument parsing"""
     # Test required arguments